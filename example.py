@@ -5,6 +5,7 @@ Example script to demonstrate the AI-Powered Personalized Newsletter Generator.
 This script fetches a small sample of articles and generates a newsletter for one user.
 """
 
+import asyncio
 import logging
 import sys
 from datetime import datetime
@@ -70,7 +71,7 @@ def main():
     
     # Fetch articles
     logger.info("Fetching articles from RSS feeds")
-    articles = rss_fetcher.fetch_all_feeds()
+    articles = asyncio.run(rss_fetcher.fetch_all_feeds_async())
     logger.info(f"Fetched {len(articles)} articles")
     
     if not articles:
@@ -101,7 +102,7 @@ def main():
         response = input("Would you like to see the newsletter content? (y/n): ")
         if response.lower() == 'y':
             print("\n" + "-" * 80)
-            print(newsletter)
+            print(newsletter.markdown)
             print("-" * 80)
 
 
@@ -1,33 +1,173 @@
+import functools
+import heapq
 import logging
+import os
 import re
 import nltk
+import spacy
 import string
-from typing import List, Dict, Set, Tuple, Optional
+import sys
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Tuple, Optional
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from scipy.sparse import csr_matrix
 from collections import Counter
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 
 from newsletter_generator.models.article import Article
 from newsletter_generator.models.user import User
+from newsletter_generator.utils.text_utils import score_sentences
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Ensure required NLTK resources are available
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    logger.info("Downloading required NLTK data...")
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('wordnet')
+# NLTK corpora required by the processor
+_NLTK_RESOURCES = ('corpora/stopwords', 'corpora/wordnet')
+_NLTK_READY = False
+
+
+def _ensure_nltk():
+    """Make sure the required NLTK corpora are available, checking once per process"""
+    global _NLTK_READY
+    if _NLTK_READY:
+        return
+    
+    for resource in _NLTK_RESOURCES:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            logger.info(f"Downloading required NLTK data: {resource}")
+            nltk.download(resource.split('/')[-1])
+    
+    _NLTK_READY = True
+
+
+@functools.lru_cache(maxsize=1)
+def _load_stop_words() -> FrozenSet[str]:
+    """Load the English stop words once and share them between processors"""
+    _ensure_nltk()
+    return frozenset(stopwords.words('english'))
+
+
+def _token_texts(doc) -> List[str]:
+    """
+    Get the token texts of a spaCy Doc, skipping whitespace.
+    
+    Unlike NLTK's tokenizer, spaCy keeps runs of extra spaces and newlines as
+    tokens. Punctuation tokens are kept, as NLTK's were, so sentence lengths
+    used for summary scoring still count them.
+    """
+    return [token.text for token in doc if not token.is_space]
+
+
+# Lookup tables shared by every processor, built once at import time
+_POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'positive', 'amazing', 'wonderful',
+    'fantastic', 'terrific', 'outstanding', 'superb', 'brilliant',
+    'success', 'successful', 'beneficial', 'advantage', 'innovative'
+})
+
+_NEGATIVE_WORDS = frozenset({
+    'bad', 'terrible', 'poor', 'negative', 'awful', 'horrible',
+    'disappointing', 'failure', 'failed', 'problem', 'disaster',
+    'crisis', 'dangerous', 'threat', 'risk', 'concern'
+})
+
+_PUNCTUATION = frozenset(string.punctuation)
+# Tokens made only of punctuation or symbols, such as "..." or "--"
+_PUNCT_TOKEN_RE = re.compile(r'[^\w\s]+')
+
+# Sentence boundaries: whitespace following terminal punctuation
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Keywords associated with each category
+_CATEGORY_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "technology": frozenset({
+        'tech', 'technology', 'ai', 'artificial', 'intelligence', 'software',
+        'app', 'application', 'computer', 'digital', 'internet', 'web',
+        'cyber', 'security', 'data', 'analytics', 'cloud', 'blockchain',
+        'programming', 'algorithm', 'mobile', 'smartphone', 'device', 
+        'hardware', 'robot', 'automation', 'startup', 'innovation',
+        'computing', 'virtual', 'augmented', 'reality'
+    }),
+    "business": frozenset({
+        'business', 'company', 'corporation', 'market', 'stock', 'finance',
+        'economy', 'economic', 'investment', 'investor', 'profit', 'revenue',
+        'startup', 'entrepreneur', 'ceo', 'executive', 'management', 'strategy',
+        'acquisition', 'merger', 'venture', 'capital', 'funding', 'growth',
+        'industry', 'sector', 'commercial', 'trade', 'banking', 'financial'
+    }),
+    "politics": frozenset({
+        'politics', 'political', 'government', 'election', 'campaign', 'vote',
+        'voter', 'president', 'congress', 'senate', 'house', 'representative',
+        'democrat', 'republican', 'liberal', 'conservative', 'policy', 'law',
+        'legislation', 'regulation', 'parliament', 'minister', 'cabinet',
+        'leader', 'party', 'candidate', 'bill', 'diplomat', 'foreign', 'nation'
+    }),
+    "entertainment": frozenset({
+        'entertainment', 'movie', 'film', 'cinema', 'actor', 'actress', 'star',
+        'celebrity', 'music', 'song', 'album', 'concert', 'perform', 'singer',
+        'band', 'television', 'tv', 'show', 'series', 'episode', 'streaming',
+        'award', 'festival', 'director', 'producer', 'studio', 'hollywood',
+        'game', 'gaming', 'theater', 'stage', 'comedy', 'drama'
+    }),
+    "health": frozenset({
+        'health', 'medical', 'medicine', 'doctor', 'hospital', 'patient', 
+        'disease', 'condition', 'treatment', 'therapy', 'drug', 'research',
+        'study', 'scientist', 'healthcare', 'mental', 'physical', 'fitness',
+        'exercise', 'diet', 'nutrition', 'wellness', 'healthy', 'vaccine',
+        'virus', 'pandemic', 'epidemic', 'public', 'emergency', 'care'
+    }),
+    "science": frozenset({
+        'science', 'scientific', 'research', 'study', 'discovery', 'scientist',
+        'experiment', 'laboratory', 'theory', 'hypothesis', 'physics', 'chemistry',
+        'biology', 'astronomy', 'space', 'planet', 'star', 'galaxy', 'universe',
+        'climate', 'environment', 'energy', 'renewable', 'sustainable', 'species',
+        'evolution', 'genetic', 'dna', 'molecule', 'atom', 'particle'
+    }),
+    "sports": frozenset({
+        'sport', 'sports', 'game', 'match', 'player', 'team', 'coach', 'league',
+        'championship', 'tournament', 'competition', 'athlete', 'olympic', 'medal',
+        'football', 'soccer', 'baseball', 'basketball', 'tennis', 'golf', 'racing',
+        'formula', 'hockey', 'rugby', 'cricket', 'boxing', 'swimming', 'track',
+        'field', 'fitness', 'stadium', 'fan', 'victory', 'defeat'
+    }),
+    "world": frozenset({
+        'world', 'international', 'global', 'foreign', 'country', 'nation',
+        'war', 'conflict', 'peace', 'military', 'army', 'troops', 'treaty',
+        'agreement', 'diplomat', 'embassy', 'ambassador', 'border', 'refugee',
+        'immigration', 'trade', 'sanction', 'united', 'nations', 'europe',
+        'asia', 'africa', 'america', 'middle', 'east', 'crisis'
+    }),
+    "general": frozenset({
+        'news', 'report', 'update', 'information', 'event', 'development',
+        'situation', 'issue', 'matter', 'topic', 'story', 'article', 'coverage',
+        'press', 'media', 'daily', 'weekly', 'monthly', 'latest', 'breaking',
+        'current', 'today', 'yesterday', 'tomorrow', 'week', 'month', 'year'
+    })
+}
+
+# Batches smaller than this are processed in-process; pool start-up isn't worth it
+_MIN_PARALLEL_BATCH = 32
+
+# Processor used by pool workers, installed once per worker by _init_worker
+_worker_processor: Optional["ArticleProcessor"] = None
+
+
+def _init_worker(processor: "ArticleProcessor"):
+    """Install the processor shipped to a freshly started pool worker"""
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _process_in_worker(article: Article) -> Optional[Article]:
+    """Process a single article inside a pool worker"""
+    try:
+        return _worker_processor._process_one(article)
+    except Exception as e:
+        logger.error(f"Error processing article {article.title}: {str(e)}")
+        return None
 
 
 class ArticleProcessor:
@@ -40,7 +180,8 @@ class ArticleProcessor:
                  categories: List[str] = None, 
                  keyword_min_length: int = 3,
                  keyword_max_count: int = 15,
-                 summarize_length: int = 3):
+                 summarize_length: int = 3,
+                 max_workers: Optional[int] = None):
         """
         Initialize the article processor.
         
@@ -49,9 +190,15 @@ class ArticleProcessor:
             keyword_min_length: Minimum length for extracted keywords
             keyword_max_count: Maximum number of keywords to extract
             summarize_length: Number of sentences in generated summaries
+            max_workers: Number of worker processes for large batches (default: CPU count)
         """
+        _ensure_nltk()
+        # The WordNet corpus itself is only read on the first lemmatize call
         self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
+        self._lemmatize = self._build_lemmatize()
+        self.stop_words = _load_stop_words()
+        # A blank English pipeline only runs spaCy's Cython tokenizer, no model needed
+        self._nlp = spacy.blank("en")
         self.categories = categories or [
             "technology", "business", "politics", "entertainment", 
             "health", "science", "sports", "world", "general"
@@ -59,12 +206,39 @@ class ArticleProcessor:
         self.keyword_min_length = keyword_min_length
         self.keyword_max_count = keyword_max_count
         self.summarize_length = summarize_length
-        self.vectorizer = TfidfVectorizer(
-            stop_words='english', 
-            max_df=0.85, 
-            min_df=0.01
-        )
-        self.category_keywords = self._initialize_category_keywords()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.category_keywords = _CATEGORY_KEYWORDS
+        self._category_list, self._keyword_index = self._build_keyword_index()
+        self._category_ids = {category: i for i, category in enumerate(self._category_list)}
+    
+    def __getstate__(self) -> dict:
+        """Drop the memoized lemmatizer and spaCy pipeline when pickling for workers"""
+        state = self.__dict__.copy()
+        del state['_lemmatize']
+        del state['_nlp']
+        return state
+    
+    def __setstate__(self, state: dict):
+        """Rebuild the memoized lemmatizer and spaCy pipeline after unpickling"""
+        self.__dict__.update(state)
+        self._lemmatize = self._build_lemmatize()
+        self._nlp = spacy.blank("en")
+    
+    def _build_lemmatize(self):
+        """
+        Build the memoized lemmatization function.
+        
+        Articles repeat the same words constantly, so WordNet lookups are cached.
+        Lemmas are interned once per distinct token, which lets the keyword index
+        and Counter lookups match them by identity.
+        """
+        lemmatize = self.lemmatizer.lemmatize
+        
+        @functools.lru_cache(maxsize=200_000)
+        def cached_lemmatize(token: str) -> str:
+            return sys.intern(lemmatize(token))
+        
+        return cached_lemmatize
         
     def process_articles(self, articles: List[Article]) -> List[Article]:
         """
@@ -82,68 +256,83 @@ class ArticleProcessor:
             logger.warning("No articles to process")
             return []
         
-        # Vectorize all article contents for similarity comparisons
-        contents = [article.content for article in articles]
-        
         try:
-            # Only fit if we have enough documents
-            if len(contents) > 1:
-                tfidf_matrix = self.vectorizer.fit_transform(contents)
-                
-                # Process each article
-                for i, article in enumerate(articles):
+            if self.max_workers > 1 and len(articles) >= _MIN_PARALLEL_BATCH:
+                # Spread the CPU-bound NLP work across worker processes
+                processed_articles = self._process_parallel(articles)
+            else:
+                # Process each article, tokenizing the whole batch in one pipe
+                lowered = [article.content.lower() for article in articles]
+                for article, content_lower, tokens in zip(articles, lowered, self._tokenize_batch(lowered)):
                     try:
-                        # Extract keywords
-                        keywords = self.extract_keywords(article.content)
-                        article.keywords = keywords
-                        
-                        # Categorize the article
-                        category = self.categorize_article(article.content, article.keywords)
-                        article.category = category
-                        
-                        # Calculate sentiment score
-                        sentiment = self.analyze_sentiment(article.content)
-                        article.sentiment_score = sentiment
-                        
-                        # Generate summary
-                        summary = self.generate_summary(article.content)
-                        article.summary = summary
-                        
-                        processed_articles.append(article)
+                        processed_articles.append(self._process_one(article, content_lower, tokens))
                     except Exception as e:
                         logger.error(f"Error processing article {article.title}: {str(e)}")
-            else:
-                # Just process the single article without vectorization
-                article = articles[0]
-                keywords = self.extract_keywords(article.content)
-                article.keywords = keywords
-                category = self.categorize_article(article.content, article.keywords)
-                article.category = category
-                sentiment = self.analyze_sentiment(article.content)
-                article.sentiment_score = sentiment
-                summary = self.generate_summary(article.content)
-                article.summary = summary
-                processed_articles.append(article)
                 
         except Exception as e:
             logger.error(f"Error in batch article processing: {str(e)}")
             # Fall back to processing articles individually
+            processed_articles = []
             for article in articles:
                 try:
-                    keywords = self.extract_keywords(article.content)
-                    article.keywords = keywords
-                    category = self.categorize_article(article.content, article.keywords)
-                    article.category = category
-                    sentiment = self.analyze_sentiment(article.content)
-                    article.sentiment_score = sentiment
-                    summary = self.generate_summary(article.content)
-                    article.summary = summary
-                    processed_articles.append(article)
+                    processed_articles.append(self._process_one(article))
                 except Exception as e:
                     logger.error(f"Error processing individual article {article.title}: {str(e)}")
         
         return processed_articles
     
+    def _process_parallel(self, articles: List[Article]) -> List[Article]:
+        """
+        Process articles in a pool of worker processes.
+        
+        Workers return processed copies of the articles, in input order.
+        
+        Args:
+            articles: List of articles to process
+            
+        Returns:
+            Processed articles, skipping any that failed
+        """
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            results = executor.map(_process_in_worker, articles, chunksize=8)
+            return [article for article in results if article is not None]
+    
+    def _process_one(self, article: Article, content_lower: Optional[str] = None,
+                     tokens: Optional[List[str]] = None) -> Article:
+        """
+        Extract keywords, category, sentiment and summary for a single article.
+        
+        Args:
+            article: Article to process
+            content_lower: Lowercased article content (computed if omitted)
+            tokens: Tokens of the lowercased content (computed if omitted)
+            
+        Returns:
+            The processed article
+        """
+        if content_lower is None:
+            content_lower = article.content.lower()
+        if tokens is None:
+            tokens = [token.text for token in self._nlp.tokenizer(content_lower)]
+        
+        # Extract keywords
+        article.keywords = self._extract_keywords_from_tokens(tokens)
+        
+        # Categorize the article
+        article.category = self.categorize_article(article.content, article.keywords)
+        
+        # Calculate sentiment score
+        article.sentiment_score = self._analyze_sentiment_from_tokens(tokens)
+        
+        # Generate summary
+        article.summary = self.generate_summary(
+            article.content, self._word_freq_from_tokens(tokens), content_lower
+        )
+        
+        return article
+    
     def calculate_relevance_for_user(self, articles: List[Article], user: User) -> List[Article]:
         """
         Calculate relevance scores for articles based on user preferences.
@@ -165,6 +354,87 @@ class ArticleProcessor:
         
         return articles
     
+    def calculate_relevance_for_users(self, articles: List[Article], users: List[User]) -> List[Article]:
+        """
+        Calculate relevance scores for articles for several users at once.
+        
+        Produces the same scores as User.matches_article, but builds the article
+        features once and scores every (article, user) pair with sparse matrix
+        products instead of one Python call per pair.
+        
+        Args:
+            articles: List of articles to score
+            users: Users to calculate relevance for
+            
+        Returns:
+            List of articles with relevance scores for every user
+        """
+        if not articles or not users:
+            return articles
+        
+        # Article features: keyword bag over a shared vocabulary, source and category ids
+        vocab: Dict[str, int] = {}
+        rows, cols = [], []
+        for i, article in enumerate(articles):
+            for keyword in article.keywords:
+                rows.append(i)
+                cols.append(vocab.setdefault(keyword.lower(), len(vocab)))
+        article_keywords = csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(articles), len(vocab))
+        )
+        
+        source_ids: Dict[str, int] = {}
+        article_sources = np.array([source_ids.setdefault(a.source, len(source_ids)) for a in articles])
+        # Categories assigned by this processor map to fixed integer ids
+        category_ids = dict(self._category_ids)
+        article_categories = np.array([category_ids.setdefault(a.category, len(category_ids)) for a in articles])
+        
+        # User preferences over the same vocabulary; interests match keywords by substring,
+        # so each user is checked against the vocabulary once instead of once per article
+        interest_rows, interest_cols = [], []
+        excluded_rows, excluded_cols = [], []
+        source_prefs = np.zeros((len(source_ids), len(users)))
+        category_prefs = np.zeros((len(category_ids), len(users)))
+        for u, user in enumerate(users):
+            interests = [interest.lower() for interest in user.interests]
+            excluded = [word.lower() for word in user.excluded_keywords]
+            for keyword, k in vocab.items():
+                if any(interest in keyword for interest in interests):
+                    interest_rows.append(k)
+                    interest_cols.append(u)
+                if any(word in keyword for word in excluded):
+                    excluded_rows.append(k)
+                    excluded_cols.append(u)
+            for source in user.preferred_sources:
+                if source in source_ids:
+                    source_prefs[source_ids[source], u] = 1.0
+            for category in user.preferred_categories:
+                if category in category_ids:
+                    category_prefs[category_ids[category], u] = 1.0
+        user_interests = csr_matrix(
+            (np.ones(len(interest_rows)), (interest_rows, interest_cols)), shape=(len(vocab), len(users))
+        )
+        user_excluded = csr_matrix(
+            (np.ones(len(excluded_rows)), (excluded_rows, excluded_cols)), shape=(len(vocab), len(users))
+        )
+        
+        # (articles x users) keyword match counts
+        interest_matches = (article_keywords @ user_interests).toarray()
+        excluded_matches = (article_keywords @ user_excluded).toarray()
+        
+        # Same scoring rules as User.matches_article
+        scores = source_prefs[article_sources] + category_prefs[article_categories]
+        interest_counts = np.array([max(len(user.interests), 1) for user in users])
+        scores += np.where(interest_matches > 0, np.minimum(interest_matches / interest_counts, 1.0) * 1.5, 0.0)
+        scores -= np.minimum(excluded_matches, 1.0) * 0.5
+        relevance = np.clip(scores / 4.0, 0.0, 1.0)
+        
+        for i, article in enumerate(articles):
+            for u, user in enumerate(users):
+                article.add_user_relevance(user.id, float(relevance[i, u]))
+        
+        return articles
+    
     def extract_keywords(self, text: str) -> List[str]:
         """
         Extract important keywords from article text.
@@ -175,24 +445,27 @@ class ArticleProcessor:
         Returns:
             List of keywords
         """
-        # Tokenize the text
-        tokens = word_tokenize(text.lower())
-        
-        # Remove stopwords and punctuation, and lemmatize
-        filtered_tokens = []
-        for token in tokens:
-            if (token not in self.stop_words and
-                token not in string.punctuation and
-                len(token) >= self.keyword_min_length and
-                not token.isdigit()):
-                lemma = self.lemmatizer.lemmatize(token)
-                filtered_tokens.append(lemma)
-        
-        # Count token frequencies
-        token_counts = Counter(filtered_tokens)
+        return self._extract_keywords_from_tokens(self._tokenize(text))
+    
+    def _extract_keywords_from_tokens(self, tokens: List[str]) -> List[str]:
+        """Extract keywords from an already lowercased token list"""
+        # Remove short tokens, stopwords and punctuation, and lemmatize, cheapest checks first
+        lemmatize = self._lemmatize
+        stop_words = self.stop_words
+        min_length = self.keyword_min_length
+        # Count token frequencies straight from the filter, without an intermediate list
+        token_counts = Counter(
+            lemmatize(token) for token in tokens
+            if len(token) >= min_length
+            and token not in stop_words
+            and token not in _PUNCTUATION
+            and not token.isdigit()
+            and not _PUNCT_TOKEN_RE.fullmatch(token)
+        )
         
         # Get the most common tokens
-        keywords = [word for word, _ in token_counts.most_common(self.keyword_max_count)]
+        top_counts = heapq.nlargest(self.keyword_max_count, token_counts.items(), key=itemgetter(1))
+        keywords = [word for word, _ in top_counts]
         
         return keywords
     
@@ -207,23 +480,20 @@ class ArticleProcessor:
         Returns:
             Predicted category
         """
-        # Simple keyword-based categorization
-        category_scores = {category: 0 for category in self.categories}
-        
-        # Check keyword matches with category keywords
+        # Simple keyword-based categorization, one index lookup per keyword
+        category_scores = [0] * len(self._category_list)
         for keyword in keywords:
-            for category, cat_keywords in self.category_keywords.items():
-                if keyword in cat_keywords:
-                    category_scores[category] += 1
+            for index in self._keyword_index.get(keyword, ()):
+                category_scores[index] += 1
         
         # If no clear category, use TF-IDF with category descriptions
-        if max(category_scores.values(), default=0) == 0:
+        best_score = max(category_scores, default=0)
+        if best_score == 0:
             # Fallback to general category
             return "general"
         
-        # Find the category with the highest score
-        best_category = max(category_scores.items(), key=lambda x: x[1])[0]
-        return best_category
+        # Find the (first) category with the highest score
+        return self._category_list[category_scores.index(best_score)]
     
     def analyze_sentiment(self, text: str) -> float:
         """
@@ -235,24 +505,15 @@ class ArticleProcessor:
         Returns:
             Sentiment score between -1 (negative) and 1 (positive)
         """
-        # Simple implementation - count positive and negative words
-        positive_words = {
-            'good', 'great', 'excellent', 'positive', 'amazing', 'wonderful', 
-            'fantastic', 'terrific', 'outstanding', 'superb', 'brilliant',
-            'success', 'successful', 'beneficial', 'advantage', 'innovative'
-        }
-        
-        negative_words = {
-            'bad', 'terrible', 'poor', 'negative', 'awful', 'horrible',
-            'disappointing', 'failure', 'failed', 'problem', 'disaster',
-            'crisis', 'dangerous', 'threat', 'risk', 'concern'
-        }
-        
-        tokens = word_tokenize(text.lower())
-        words = [token for token in tokens if token.isalpha()]
+        return self._analyze_sentiment_from_tokens(self._tokenize(text))
+    
+    def _analyze_sentiment_from_tokens(self, tokens: List[str]) -> float:
+        """Score sentiment from an already lowercased token list"""
+        # Simple implementation - count positive and negative words in one pass
+        counts = Counter(token for token in tokens if token.isalpha())
         
-        pos_count = sum(1 for word in words if word in positive_words)
-        neg_count = sum(1 for word in words if word in negative_words)
+        pos_count = sum(counts[word] for word in _POSITIVE_WORDS & counts.keys())
+        neg_count = sum(counts[word] for word in _NEGATIVE_WORDS & counts.keys())
         
         total = pos_count + neg_count
         if total == 0:
@@ -260,18 +521,21 @@ class ArticleProcessor:
         
         return (pos_count - neg_count) / total
     
-    def generate_summary(self, text: str) -> str:
+    def generate_summary(self, text: str, word_freq: Optional[Dict[str, int]] = None,
+                         text_lower: Optional[str] = None) -> str:
         """
         Generate a summary of the article text.
         
         Args:
             text: Article content
+            word_freq: Precomputed word frequencies for the text (computed if omitted)
+            text_lower: Lowercased article content, if already available
             
         Returns:
             Summary text
         """
         # Simple extractive summarization - select the most important sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENT_SPLIT.split(text)
         
         if not sentences:
             return ""
@@ -280,20 +544,23 @@ class ArticleProcessor:
             return text
         
         # Calculate sentence scores based on word frequency
-        word_freq = self._calculate_word_frequencies(text)
-        scores = {}
-        
-        for i, sentence in enumerate(sentences):
-            words = word_tokenize(sentence.lower())
-            score = sum(word_freq.get(word, 0) for word in words if word.isalpha())
-            # Normalize by sentence length to avoid bias toward longer sentences
-            if len(words) > 0:
-                scores[i] = score / len(words)
-            else:
-                scores[i] = 0
+        if word_freq is None:
+            word_freq = self._calculate_word_frequencies(text)
+        
+        # Lowercasing never adds or removes sentence boundaries, so splitting the
+        # lowercased text yields the same sentences without lowercasing them again
+        lowered_sentences = _SENT_SPLIT.split(text_lower) if text_lower is not None else None
+        if lowered_sentences is None or len(lowered_sentences) != len(sentences):
+            lowered_sentences = [sentence.lower() for sentence in sentences]
+        
+        # Score sentences by word frequency, normalized by sentence length to
+        # avoid bias toward longer sentences; word_freq only holds alphabetic
+        # words, so punctuation tokens only add to the length
+        sentence_tokens = list(self._tokenize_batch(lowered_sentences))
+        scores = score_sentences(sentence_tokens, word_freq)
         
         # Get the top sentences
-        top_indices = sorted(scores, key=scores.get, reverse=True)[:self.summarize_length]
+        top_indices = heapq.nlargest(self.summarize_length, range(len(scores)), key=scores.__getitem__)
         top_indices.sort()  # Sort by original order
         
         summary_sentences = [sentences[i] for i in top_indices]
@@ -301,81 +568,38 @@ class ArticleProcessor:
         
         return summary
     
+    def _tokenize(self, text: str) -> List[str]:
+        """Lowercase and tokenize text"""
+        return _token_texts(self._nlp.tokenizer(text.lower()))
+    
+    def _tokenize_batch(self, lowered_texts: Iterable[str]) -> Iterator[List[str]]:
+        """Tokenize several already lowercased texts, batching them through spaCy"""
+        for doc in self._nlp.tokenizer.pipe(lowered_texts, batch_size=64):
+            yield _token_texts(doc)
+    
     def _calculate_word_frequencies(self, text: str) -> Dict[str, int]:
         """Calculate word frequencies in the text"""
-        words = word_tokenize(text.lower())
-        filtered_words = [word for word in words 
+        return self._word_freq_from_tokens(self._tokenize(text))
+    
+    def _word_freq_from_tokens(self, tokens: List[str]) -> Dict[str, int]:
+        """Calculate word frequencies from an already lowercased token list"""
+        filtered_words = [word for word in tokens 
                          if word.isalpha() and word not in self.stop_words]
         
         return Counter(filtered_words)
     
-    def _initialize_category_keywords(self) -> Dict[str, Set[str]]:
-        """Initialize keywords associated with each category"""
-        keywords = {
-            "technology": {
-                'tech', 'technology', 'ai', 'artificial', 'intelligence', 'software',
-                'app', 'application', 'computer', 'digital', 'internet', 'web',
-                'cyber', 'security', 'data', 'analytics', 'cloud', 'blockchain',
-                'programming', 'algorithm', 'mobile', 'smartphone', 'device', 
-                'hardware', 'robot', 'automation', 'startup', 'innovation',
-                'computing', 'virtual', 'augmented', 'reality'
-            },
-            "business": {
-                'business', 'company', 'corporation', 'market', 'stock', 'finance',
-                'economy', 'economic', 'investment', 'investor', 'profit', 'revenue',
-                'startup', 'entrepreneur', 'ceo', 'executive', 'management', 'strategy',
-                'acquisition', 'merger', 'venture', 'capital', 'funding', 'growth',
-                'industry', 'sector', 'commercial', 'trade', 'banking', 'financial'
-            },
-            "politics": {
-                'politics', 'political', 'government', 'election', 'campaign', 'vote',
-                'voter', 'president', 'congress', 'senate', 'house', 'representative',
-                'democrat', 'republican', 'liberal', 'conservative', 'policy', 'law',
-                'legislation', 'regulation', 'parliament', 'minister', 'cabinet',
-                'leader', 'party', 'candidate', 'bill', 'diplomat', 'foreign', 'nation'
-            },
-            "entertainment": {
-                'entertainment', 'movie', 'film', 'cinema', 'actor', 'actress', 'star',
-                'celebrity', 'music', 'song', 'album', 'concert', 'perform', 'singer',
-                'band', 'television', 'tv', 'show', 'series', 'episode', 'streaming',
-                'award', 'festival', 'director', 'producer', 'studio', 'hollywood',
-                'game', 'gaming', 'theater', 'stage', 'comedy', 'drama'
-            },
-            "health": {
-                'health', 'medical', 'medicine', 'doctor', 'hospital', 'patient', 
-                'disease', 'condition', 'treatment', 'therapy', 'drug', 'research',
-                'study', 'scientist', 'healthcare', 'mental', 'physical', 'fitness',
-                'exercise', 'diet', 'nutrition', 'wellness', 'healthy', 'vaccine',
-                'virus', 'pandemic', 'epidemic', 'public', 'emergency', 'care'
-            },
-            "science": {
-                'science', 'scientific', 'research', 'study', 'discovery', 'scientist',
-                'experiment', 'laboratory', 'theory', 'hypothesis', 'physics', 'chemistry',
-                'biology', 'astronomy', 'space', 'planet', 'star', 'galaxy', 'universe',
-                'climate', 'environment', 'energy', 'renewable', 'sustainable', 'species',
-                'evolution', 'genetic', 'dna', 'molecule', 'atom', 'particle'
-            },
-            "sports": {
-                'sport', 'sports', 'game', 'match', 'player', 'team', 'coach', 'league',
-                'championship', 'tournament', 'competition', 'athlete', 'olympic', 'medal',
-                'football', 'soccer', 'baseball', 'basketball', 'tennis', 'golf', 'racing',
-                'formula', 'hockey', 'rugby', 'cricket', 'boxing', 'swimming', 'track',
-                'field', 'fitness', 'stadium', 'fan', 'victory', 'defeat'
-            },
-            "world": {
-                'world', 'international', 'global', 'foreign', 'country', 'nation',
-                'war', 'conflict', 'peace', 'military', 'army', 'troops', 'treaty',
-                'agreement', 'diplomat', 'embassy', 'ambassador', 'border', 'refugee',
-                'immigration', 'trade', 'sanction', 'united', 'nations', 'europe',
-                'asia', 'africa', 'america', 'middle', 'east', 'crisis'
-            },
-            "general": {
-                'news', 'report', 'update', 'information', 'event', 'development',
-                'situation', 'issue', 'matter', 'topic', 'story', 'article', 'coverage',
-                'press', 'media', 'daily', 'weekly', 'monthly', 'latest', 'breaking',
-                'current', 'today', 'yesterday', 'tomorrow', 'week', 'month', 'year'
-            }
-        }
-        
-        # Convert lists to sets for faster lookups
-        return {k: set(v) for k, v in keywords.items()}
+    def _build_keyword_index(self) -> Tuple[List[str], Dict[str, Tuple[int, ...]]]:
+        """
+        Build an inverted index from category keywords to category positions.
+        
+        Returns:
+            The list of categories and a mapping from each keyword to the
+            indices (in that list) of the categories it belongs to
+        """
+        category_list = [sys.intern(category) for category in self.categories]
+        index: Dict[str, List[int]] = {}
+        for position, category in enumerate(category_list):
+            for keyword in self.category_keywords.get(category, ()):
+                index.setdefault(keyword, []).append(position)
+        
+        return category_list, {keyword: tuple(positions) for keyword, positions in index.items()}
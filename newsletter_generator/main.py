@@ -3,6 +3,8 @@
 import os
 import sys
 import argparse
+import asyncio
+import functools
 import logging
 import schedule
 import time
@@ -27,6 +29,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_article_processor() -> ArticleProcessor:
+    """Return the process-wide ArticleProcessor, created on first use"""
+    return ArticleProcessor()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_newsletter_generator() -> NewsletterGenerator:
+    """Return the process-wide NewsletterGenerator, created on first use"""
+    return NewsletterGenerator()
+
+
 def process_data(rss_feeds: Dict[str, List[str]], user_ids: List[str] = None) -> None:
     """
     Main processing function to fetch, process articles and generate newsletters.
@@ -37,11 +51,12 @@ def process_data(rss_feeds: Dict[str, List[str]], user_ids: List[str] = None) ->
     """
     logger.info("Starting newsletter generation process")
     
-    # Create components
+    # Create components; the processor and generator are reused across scheduled
+    # runs, while users and feeds are reloaded each time in case they changed
     user_manager = UserManager()
     rss_fetcher = RSSFetcher(rss_feeds)
-    article_processor = ArticleProcessor()
-    newsletter_generator = NewsletterGenerator()
+    article_processor = _get_article_processor()
+    newsletter_generator = _get_newsletter_generator()
     
     # Get users
     if user_ids:
@@ -56,9 +71,9 @@ def process_data(rss_feeds: Dict[str, List[str]], user_ids: List[str] = None) ->
     
     logger.info(f"Processing for {len(users)} users")
     
-    # Fetch articles from all feeds
+    # Fetch articles from all feeds concurrently
     logger.info("Fetching articles from RSS feeds")
-    articles = rss_fetcher.fetch_all_feeds()
+    articles = asyncio.run(rss_fetcher.fetch_all_feeds_async())
     logger.info(f"Fetched {len(articles)} articles")
     
     if not articles:
@@ -70,17 +85,15 @@ def process_data(rss_feeds: Dict[str, List[str]], user_ids: List[str] = None) ->
     processed_articles = article_processor.process_articles(articles)
     logger.info(f"Processed {len(processed_articles)} articles")
     
-    # Generate newsletter for each user
-    for user in users:
-        logger.info(f"Generating newsletter for {user.name}")
-        
-        # Calculate relevance scores for this user
-        user_articles = article_processor.calculate_relevance_for_user(processed_articles, user)
-        
-        # Generate newsletter
-        newsletter = newsletter_generator.generate_newsletter(user, user_articles)
-        
-        logger.info(f"Generated newsletter for {user.name}")
+    # Calculate relevance scores for all users in one pass
+    logger.info("Calculating article relevance for all users")
+    user_articles = article_processor.calculate_relevance_for_users(processed_articles, users)
+    
+    # Generate newsletters for all users; article entries rendered for a
+    # previous batch no longer apply
+    newsletter_generator.clear_article_cache()
+    newsletters = newsletter_generator.generate_for_users(users, user_articles)
+    logger.info(f"Generated {len(newsletters)} of {len(users)} newsletters")
     
     logger.info("Newsletter generation process completed")
 
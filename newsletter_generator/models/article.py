@@ -1,9 +1,16 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import datetime
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 date string; many stored articles share a timestamp"""
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class Article:
     """
     Class representing a news article with metadata and content.
@@ -44,7 +51,7 @@ class Article:
     def from_dict(cls, data: dict) -> 'Article':
         """Create an Article instance from a dictionary"""
         # Parse the date from ISO format string
-        pub_date = datetime.fromisoformat(data["published_date"]) if isinstance(data["published_date"], str) else data["published_date"]
+        pub_date = _parse_iso(data["published_date"]) if isinstance(data["published_date"], str) else data["published_date"]
         
         return cls(
             id=data["id"],
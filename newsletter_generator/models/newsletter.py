@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class NewsletterBundle:
+    """
+    Class representing a generated newsletter in all of its output formats.
+    The HTML is rendered once from the Markdown and shared by every consumer.
+    """
+    markdown: str  # Newsletter content in Markdown format
+    html: str  # Markdown content rendered to HTML (body only, no page wrapper)
+    generated_at: datetime  # Generation time, used for every date shown or saved
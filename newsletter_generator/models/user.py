@@ -1,8 +1,19 @@
+import re
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, FrozenSet, Optional, Pattern, Tuple
 
+# Upper bound on memoized article scores per user
+_SCORE_CACHE_SIZE = 100_000
 
-@dataclass
+
+def _substring_pattern(words: List[str]) -> Optional[Pattern]:
+    """Compile a regex matching any of the lowercased words as a substring"""
+    if not words:
+        return None
+    return re.compile('|'.join(re.escape(word.lower()) for word in words))
+
+
+@dataclass(slots=True)
 class User:
     """
     Class representing a user of the newsletter system.
@@ -21,6 +32,32 @@ class User:
     language: str = "en"
     location: Optional[str] = None
     persona: Optional[str] = None
+    # Lookups derived from the preferences above, see refresh_preferences()
+    _preferred_sources_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _preferred_categories_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _interest_re: Optional[Pattern] = field(init=False, repr=False, compare=False)
+    _excluded_re: Optional[Pattern] = field(init=False, repr=False, compare=False)
+    _score_cache: Dict[Tuple[Tuple[str, ...], str, str], float] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.refresh_preferences()
+    
+    def refresh_preferences(self):
+        """
+        Rebuild the lookups used for matching articles.
+        
+        Called on creation; call again after changing interests, sources,
+        categories or excluded keywords.
+        """
+        self._preferred_sources_set = frozenset(self.preferred_sources)
+        self._preferred_categories_set = frozenset(self.preferred_categories)
+        self._interest_re = _substring_pattern(self.interests)
+        self._excluded_re = _substring_pattern(self.excluded_keywords)
+        self.clear_score_cache()
+    
+    def clear_score_cache(self):
+        """Forget memoized article scores"""
+        self._score_cache = {}
     
     def to_dict(self) -> dict:
         """Convert the user to a dictionary for storage"""
@@ -63,6 +100,9 @@ class User:
         """
         Calculate a relevance score for an article based on user preferences.
         
+        Scores are memoized per (keywords, source, category), so scoring the
+        same article again, or a duplicate of it, is a dictionary lookup.
+        
         Args:
             article_keywords: List of keywords extracted from the article
             source: The source of the article
@@ -71,28 +111,38 @@ class User:
         Returns:
             float: Relevance score between 0 and 1
         """
+        key = (tuple(article_keywords), source, category)
+        score = self._score_cache.get(key)
+        if score is None:
+            if len(self._score_cache) >= _SCORE_CACHE_SIZE:
+                self._score_cache.clear()
+            score = self._score_cache[key] = self._score_article(article_keywords, source, category)
+        return score
+    
+    def _score_article(self, article_keywords: List[str], source: str, category: str) -> float:
+        """Score an article against the user's preferences (see matches_article)"""
         score = 0.0
         max_score = 4.0  # Maximum possible score
         
         # Check if article is from preferred source
-        if source in self.preferred_sources:
+        if source in self._preferred_sources_set:
             score += 1.0
             
         # Check if article is in preferred category
-        if category in self.preferred_categories:
+        if category in self._preferred_categories_set:
             score += 1.0
+        
+        keywords_lower = [keyword.lower() for keyword in article_keywords]
             
         # Check for keyword matches with interests
-        interest_match = sum(1 for keyword in article_keywords if any(
-            interest.lower() in keyword.lower() for interest in self.interests
-        ))
+        interest_re = self._interest_re
+        interest_match = sum(1 for keyword in keywords_lower if interest_re.search(keyword)) if interest_re else 0
         if interest_match > 0:
             score += min(interest_match / len(self.interests), 1.0) * 1.5
             
         # Check for excluded keywords
-        excluded_match = sum(1 for keyword in article_keywords if any(
-            excluded.lower() in keyword.lower() for excluded in self.excluded_keywords
-        ))
+        excluded_re = self._excluded_re
+        excluded_match = sum(1 for keyword in keywords_lower if excluded_re.search(keyword)) if excluded_re else 0
         if excluded_match > 0:
             score -= min(excluded_match, 1.0) * 0.5
             
@@ -1,16 +1,104 @@
 import os
+import heapq
 import logging
 import markdown
+import string
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 
 from newsletter_generator.models.article import Article
+from newsletter_generator.models.newsletter import NewsletterBundle
 from newsletter_generator.models.user import User
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Smallest number of users worth starting worker processes for
+_MIN_PARALLEL_USERS = 8
+
+# Generator and shared articles used by pool workers, installed once per worker by _init_worker
+_worker_generator: Optional["NewsletterGenerator"] = None
+_worker_articles: List[Article] = []
+_worker_now: Optional[datetime] = None
+
+
+def _init_worker(output_dir: str, articles: List[Article], now: datetime):
+    """Set up a freshly started pool worker with its generator and the shared batch data"""
+    global _worker_generator, _worker_articles, _worker_now
+    _worker_generator = NewsletterGenerator(output_dir)
+    _worker_articles = articles
+    _worker_now = now
+
+
+def _generate_in_worker(user: User) -> Optional[NewsletterBundle]:
+    """Generate a single user's newsletter inside a pool worker"""
+    return _generate_or_log(_worker_generator, user, _worker_articles, _worker_now)
+
+
+def _generate_or_log(generator: "NewsletterGenerator", user: User, articles: List[Article],
+                     now: datetime) -> Optional[NewsletterBundle]:
+    """Generate a newsletter, logging failures instead of raising them"""
+    try:
+        return generator.generate_newsletter(user, articles, now=now)
+    except Exception as e:
+        logger.error(f"Error generating newsletter for {user.name}: {str(e)}")
+        return None
+
+
+# HTML page wrapped around the rendered newsletter, with basic CSS for readability
+_HTML_HEAD_TMPL = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>$title</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; margin: 0 auto; max-width: 800px; padding: 20px; }
+        h1, h2, h3 { color: #333; }
+        a { color: #0066cc; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+        hr { border: 0; border-top: 1px solid #ddd; margin: 20px 0; }
+        .source { color: #666; font-style: italic; font-size: 0.9em; }
+    </style>
+</head>
+<body>
+    """)
+_HTML_TAIL = """
+</body>
+</html>"""
+
+
+@lru_cache(maxsize=1024)
+def _render_footer(interests: Tuple[str, ...], preferred_sources: Tuple[str, ...]) -> str:
+    """
+    Render the preferences footer of a newsletter.
+    
+    The footer only depends on the user's preferences, so it is rendered once
+    per distinct set of preferences and reused across newsletters.
+    
+    Args:
+        interests: User's interests
+        preferred_sources: User's preferred news sources
+        
+    Returns:
+        Footer content in Markdown format
+    """
+    return "\n".join((
+        "## Your Newsletter Preferences",
+        "",
+        "Your newsletter is customized based on your interests:",
+        "",
+        f"**Interests:** {', '.join(interests)}",
+        "",
+        f"**Preferred Sources:** {', '.join(preferred_sources)}",
+        "",
+        "*To update your preferences or unsubscribe, click [here](#).*"
+    ))
+
 
 class NewsletterGenerator:
     """
@@ -26,10 +114,25 @@ class NewsletterGenerator:
         """
         self.output_dir = output_dir
         
+        # Rendered markdown per (article ID, is top story), shared by all subscribers
+        self._article_md_cache: Dict[Tuple[str, bool], str] = {}
+        
+        # Markdown converter reused across newsletters; it keeps per-conversion
+        # state, so conversions are serialized
+        self._md = markdown.Markdown()
+        self._md_lock = threading.Lock()
+        
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
+        # Directories known to exist, so repeat saves skip the mkdir call
+        self._ensured_dirs = {Path(output_dir)}
     
-    def generate_newsletter(self, user: User, articles: List[Article], max_articles: int = None) -> str:
+    def clear_article_cache(self):
+        """Drop rendered article fragments, e.g. before a new batch of articles"""
+        self._article_md_cache.clear()
+    
+    def generate_newsletter(self, user: User, articles: List[Article], max_articles: int = None,
+                            now: Optional[datetime] = None) -> NewsletterBundle:
         """
         Generate a personalized newsletter for a user.
         
@@ -37,222 +140,272 @@ class NewsletterGenerator:
             user: User to generate newsletter for
             articles: List of articles to choose from
             max_articles: Maximum number of articles to include (default: user preference)
+            now: Generation time used for every date in the newsletter (default: current time)
             
         Returns:
-            Generated newsletter content in Markdown format
+            Generated newsletter in Markdown and HTML format
         """
         if max_articles is None:
             max_articles = user.max_articles_per_newsletter
+        if now is None:
+            now = datetime.now()
             
         logger.info(f"Generating newsletter for {user.name} with up to {max_articles} articles")
         
-        # Filter articles with relevance scores for this user
-        relevant_articles = [a for a in articles if user.id in a.relevance_scores]
+        # Look up each relevant article's score once
+        user_id = user.id
+        scored = [(a.relevance_scores[user_id], a) for a in articles if user_id in a.relevance_scores]
         
-        # Sort articles by relevance score (descending)
-        sorted_articles = sorted(
-            relevant_articles, 
-            key=lambda a: a.relevance_scores.get(user.id, 0), 
-            reverse=True
-        )
+        # Take the top N articles by relevance (descending) without sorting them all
+        selected_articles = [a for _, a in heapq.nlargest(max_articles, scored, key=itemgetter(0))]
         
-        # Take the top N articles
-        selected_articles = sorted_articles[:max_articles]
-        
-        # Group articles by category
-        categorized_articles: Dict[str, List[Article]] = {}
-        for article in selected_articles:
-            if article.category not in categorized_articles:
-                categorized_articles[article.category] = []
-            categorized_articles[article.category].append(article)
-        
-        # Generate newsletter content
-        newsletter = self._generate_markdown(user, categorized_articles)
+        # Generate newsletter content, rendering the HTML once for all consumers
+        content = self._generate_markdown(user, selected_articles, now.strftime("%B %d, %Y"))
+        newsletter = NewsletterBundle(markdown=content, html=self._render_html(content), generated_at=now)
         
         # Save the newsletter to a file
         self._save_newsletter(user, newsletter)
         
         return newsletter
     
-    def _generate_markdown(self, user: User, categorized_articles: Dict[str, List[Article]]) -> str:
+    def generate_for_users(self, users: List[User], articles: List[Article],
+                           max_workers: Optional[int] = None) -> Dict[str, NewsletterBundle]:
+        """
+        Generate newsletters for several users.
+        
+        Larger batches are spread across worker processes. The articles are sent
+        to each worker once, and every worker renders with its own generator.
+        All newsletters in the batch share one generation time.
+        
+        Args:
+            users: Users to generate newsletters for
+            articles: List of articles to choose from, with relevance scores for the users
+            max_workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            Dictionary mapping user IDs to their generated newsletters; users whose
+            newsletter failed are left out
+        """
+        max_workers = min(max_workers or os.cpu_count() or 1, len(users))
+        now = datetime.now()
+        
+        if max_workers > 1 and len(users) >= _MIN_PARALLEL_USERS:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_worker,
+                                     initargs=(self.output_dir, articles, now)) as executor:
+                results = list(executor.map(_generate_in_worker, users, chunksize=4))
+        else:
+            results = [_generate_or_log(self, user, articles, now) for user in users]
+        
+        return {
+            user.id: newsletter
+            for user, newsletter in zip(users, results)
+            if newsletter is not None
+        }
+    
+    def _generate_markdown(self, user: User, selected_articles: List[Article], date_str: str) -> str:
         """
         Generate newsletter content in Markdown format.
         
         Args:
             user: User the newsletter is for
-            categorized_articles: Dictionary mapping categories to lists of articles
+            selected_articles: Articles to include, sorted by relevance (descending)
+            date_str: Display date of the newsletter
             
         Returns:
             Newsletter content in Markdown format
         """
-        now = datetime.now()
-        date_str = now.strftime("%B %d, %Y")
-        
-        # Start with newsletter header
-        lines = [
+        return "\n".join((
+            self._header(user, date_str),
+            self._body(selected_articles),
+            _render_footer(tuple(user.interests), tuple(user.preferred_sources))
+        ))
+    
+    def _header(self, user: User, date_str: str) -> str:
+        """Render the newsletter title block"""
+        return "\n".join((
             f"# {user.name}'s Personalized Newsletter",
             f"### {date_str}",
             "",
             "## Today's Top Stories",
             ""
-        ]
+        ))
+    
+    def _body(self, selected_articles: List[Article]) -> str:
+        """
+        Render the top stories followed by a section per category.
         
-        # Find the top 3 articles across all categories
-        all_articles = []
-        for category_articles in categorized_articles.values():
-            all_articles.extend(category_articles)
+        Args:
+            selected_articles: Articles to include, sorted by relevance (descending)
+            
+        Returns:
+            Newsletter body in Markdown format
+        """
+        lines = []
+        append = lines.append
         
-        top_articles = sorted(
-            all_articles, 
-            key=lambda a: a.relevance_scores.get(user.id, 0), 
-            reverse=True
-        )[:3]
+        # The top 3 articles across all categories; the selection is already sorted
+        top_articles = selected_articles[:3]
+        # Identity set, so membership checks don't compare articles field by field
+        top_ids = {id(a) for a in top_articles}
+        
+        # Group articles by category
+        categorized_articles: Dict[str, List[Article]] = {}
+        for article in selected_articles:
+            if article.category not in categorized_articles:
+                categorized_articles[article.category] = []
+            categorized_articles[article.category].append(article)
         
         # Add summaries for top articles
         for article in top_articles:
-            lines.append(f"### [{article.title}]({article.url})")
-            if article.summary:
-                lines.append(f"{article.summary}")
-            lines.append(f"*Source: {article.source}*")
-            lines.append("")
+            append(self._render_article(article, True))
+            append("")
         
         # Add a divider
-        lines.append("---")
-        lines.append("")
+        append("---")
+        append("")
         
         # Add sections for each category
         for category, articles in categorized_articles.items():
             # Skip if category is empty or all articles are in the top section
-            if not articles or all(a in top_articles for a in articles):
+            if not articles or all(id(a) in top_ids for a in articles):
                 continue
             
             # Capitalize category name
             category_name = category.capitalize()
-            lines.append(f"## {category_name}")
-            lines.append("")
+            append(f"## {category_name}")
+            append("")
             
             # Add articles for this category (excluding top articles)
             for article in articles:
-                if article not in top_articles:
-                    lines.append(f"### [{article.title}]({article.url})")
-                    
-                    # Add author if available
-                    if article.author:
-                        lines.append(f"*By {article.author}*")
-                    
-                    # Add summary if available
-                    if article.summary:
-                        lines.append(f"{article.summary}")
-                    
-                    # Add source and date
-                    pub_date = article.published_date.strftime("%B %d, %Y")
-                    lines.append(f"*Source: {article.source} | {pub_date}*")
-                    lines.append("")
+                if id(article) not in top_ids:
+                    append(self._render_article(article, False))
+                    append("")
             
             # Add a divider after each category
-            lines.append("---")
-            lines.append("")
+            append("---")
+            append("")
+        
+        return "\n".join(lines)
+    
+    def _render_article(self, article: Article, is_top: bool) -> str:
+        """
+        Render a single article entry, reusing it across newsletters.
         
-        # Add footer
-        lines.append("## Your Newsletter Preferences")
-        lines.append("")
-        lines.append("Your newsletter is customized based on your interests:")
-        lines.append("")
+        Args:
+            article: Article to render
+            is_top: Whether the article is listed under the top stories
+            
+        Returns:
+            Article entry in Markdown format
+        """
+        key = (article.id, is_top)
+        rendered = self._article_md_cache.get(key)
+        if rendered is not None:
+            return rendered
         
-        # Add user interests
-        interest_list = ", ".join(user.interests)
-        lines.append(f"**Interests:** {interest_list}")
-        lines.append("")
+        lines = [f"### [{article.title}]({article.url})"]
         
-        # Add preferred sources
-        source_list = ", ".join(user.preferred_sources)
-        lines.append(f"**Preferred Sources:** {source_list}")
-        lines.append("")
+        if is_top:
+            if article.summary:
+                lines.append(f"{article.summary}")
+            lines.append(f"*Source: {article.source}*")
+        else:
+            # Add author if available
+            if article.author:
+                lines.append(f"*By {article.author}*")
+            
+            # Add summary if available
+            if article.summary:
+                lines.append(f"{article.summary}")
+            
+            # Add source and date
+            pub_date = article.published_date.strftime("%B %d, %Y")
+            lines.append(f"*Source: {article.source} | {pub_date}*")
         
-        # Add unsubscribe notice
-        lines.append("*To update your preferences or unsubscribe, click [here](#).*")
+        rendered = "\n".join(lines)
+        self._article_md_cache[key] = rendered
+        return rendered
+    
+    def _render_html(self, content: str) -> str:
+        """
+        Convert newsletter Markdown to HTML.
         
-        # Join all lines with newlines
-        return "\n".join(lines)
+        Args:
+            content: Newsletter content in Markdown format
+            
+        Returns:
+            Rendered HTML body
+        """
+        with self._md_lock:
+            return self._md.reset().convert(content)
     
-    def _save_newsletter(self, user: User, content: str, format: str = "md"):
+    def _save_newsletter(self, user: User, newsletter: NewsletterBundle):
         """
-        Save the newsletter to a file.
+        Save the newsletter to Markdown and HTML files.
         
         Args:
             user: User the newsletter is for
-            content: Newsletter content
-            format: Output format ('md' for Markdown, 'html' for HTML)
+            newsletter: Generated newsletter
         """
         # Create a filename with user name and date
-        date_str = datetime.now().strftime("%Y%m%d")
+        date_str = newsletter.generated_at.strftime("%Y%m%d")
         user_name = user.name.lower().replace(" ", "_")
-        filename = f"{user_name}_{date_str}.{format}"
+        filename = f"{user_name}_{date_str}.md"
         
         # Create user directory if it doesn't exist
-        user_dir = os.path.join(self.output_dir, user_name)
-        os.makedirs(user_dir, exist_ok=True)
+        user_dir = Path(self.output_dir, user_name)
+        if user_dir not in self._ensured_dirs:
+            user_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(user_dir)
         
         # Save to file
-        file_path = os.path.join(user_dir, filename)
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        file_path = user_dir / filename
+        try:
+            f = open(file_path, "w", encoding="utf-8")
+        except FileNotFoundError:
+            # The directory was removed since it was created, e.g. between
+            # scheduled runs of the long-lived generator
+            user_dir.mkdir(parents=True, exist_ok=True)
+            f = open(file_path, "w", encoding="utf-8")
+        with f:
+            f.write(newsletter.markdown)
         
         logger.info(f"Saved newsletter to {file_path}")
         
-        # Optionally convert to HTML and save
-        if format == "md":
-            try:
-                html_content = markdown.markdown(content)
-                html_filename = filename.replace(".md", ".html")
-                html_path = os.path.join(user_dir, html_filename)
-                
-                with open(html_path, "w", encoding="utf-8") as f:
-                    # Add basic HTML structure and CSS for better readability
-                    f.write(f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <title>{user.name}'s Newsletter</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 0 auto; max-width: 800px; padding: 20px; }}
-        h1, h2, h3 {{ color: #333; }}
-        a {{ color: #0066cc; text-decoration: none; }}
-        a:hover {{ text-decoration: underline; }}
-        hr {{ border: 0; border-top: 1px solid #ddd; margin: 20px 0; }}
-        .source {{ color: #666; font-style: italic; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    {html_content}
-</body>
-</html>""")
-                
-                logger.info(f"Saved HTML version to {html_path}")
-            except Exception as e:
-                logger.error(f"Error converting to HTML: {str(e)}")
+        # Save the HTML version as well
+        try:
+            html_path = file_path.with_suffix(".html")
+            
+            with open(html_path, "w", encoding="utf-8") as f:
+                f.write(_HTML_HEAD_TMPL.substitute(title=f"{user.name}'s Newsletter"))
+                f.write(newsletter.html)
+                f.write(_HTML_TAIL)
+            
+            logger.info(f"Saved HTML version to {html_path}")
+        except Exception as e:
+            logger.error(f"Error saving HTML version: {str(e)}")
     
-    def delivery_email(self, user: User, newsletter_content: str) -> Dict[str, Any]:
+    def delivery_email(self, user: User, newsletter: NewsletterBundle) -> Dict[str, Any]:
         """
         Prepare an email delivery for a newsletter.
         
         Args:
             user: User to deliver to
-            newsletter_content: Newsletter content
+            newsletter: Newsletter returned by generate_newsletter
             
         Returns:
             Dictionary with email delivery information
         """
         # This would integrate with an email service in a real implementation
         # Here we just return the structure of what would be sent
-        date_str = datetime.now().strftime("%B %d, %Y")
+        date_str = newsletter.generated_at.strftime("%B %d, %Y")
         
         email_data = {
             "to": user.email,
             "subject": f"Your Personalized Newsletter - {date_str}",
-            "body_html": markdown.markdown(newsletter_content),
-            "body_text": newsletter_content,
+            "body_html": newsletter.html,
+            "body_text": newsletter.markdown,
             "from": "newsletter@example.com",
             "user_id": user.id
         }
@@ -1,19 +1,39 @@
+import asyncio
 import feedparser
+import html
+import re
 import requests
 import uuid
+import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 
 from newsletter_generator.models.article import Article
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_TAG_RE = re.compile(r'</?[A-Za-z][^>]*>')
+_IMG_SRC_RE = re.compile(r'<img\b[^>]*?\ssrc\s*=\s*["\']([^"\']+)', re.I)
+# Markup whose text must be dropped rather than kept, which needs a real parser
+_NON_TEXT_MARKUP_RE = re.compile(r'<(?:script|style|!|\?)', re.I)
+
+
+def _make_soup(content: str) -> BeautifulSoup:
+    """Parse HTML with lxml, falling back to the pure-Python parser if it is missing"""
+    try:
+        return BeautifulSoup(content, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(content, 'html.parser')
+
 
 class RSSFetcher:
     """
@@ -21,7 +41,9 @@ class RSSFetcher:
     """
     
     def __init__(self, feed_urls: Dict[str, List[str]], request_timeout: int = 10, 
-                 max_articles_per_feed: int = 10, retry_attempts: int = 3):
+                 max_articles_per_feed: int = 10, retry_attempts: int = 3,
+                 max_concurrency: int = 20, cache_dir: str = "newsletter_generator/data",
+                 cache_ttl: int = 86400, min_host_interval: float = 1.0):
         """
         Initialize the RSS fetcher.
         
@@ -29,41 +51,106 @@ class RSSFetcher:
             feed_urls: Dictionary mapping source categories to lists of RSS feed URLs
             request_timeout: Timeout in seconds for HTTP requests
             max_articles_per_feed: Maximum number of articles to fetch from each feed
-            retry_attempts: Number of retry attempts for failed requests
+            retry_attempts: Maximum number of attempts per request, including the first
+            max_concurrency: Maximum number of feeds fetched at the same time
+            cache_dir: Directory to store the feed cache
+            cache_ttl: Seconds a cached feed may be revalidated before it is refetched in full
+            min_host_interval: Minimum seconds between requests to the same host
         """
         self.feed_urls = feed_urls
         self.request_timeout = request_timeout
         self.max_articles_per_feed = max_articles_per_feed
         self.retry_attempts = retry_attempts
+        self.max_concurrency = max_concurrency
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        self.min_host_interval = min_host_interval
+        # One lock per host so concurrent fetches never hit the same server at once,
+        # and when each host was last requested (only touched under its host lock)
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._host_locks_guard = threading.Lock()
+        self._last_hit: Dict[str, float] = {}
+        self.session = self._create_session()
+        
+        # Validators and parsed articles per feed URL, for conditional requests
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, "feed_cache.json")
+        self.cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+        self._feed_cache: Dict[str, dict] = self._load_cache()
     
     def fetch_all_feeds(self) -> List[Article]:
         """
         Fetch articles from all configured RSS feeds.
         
+        Feeds are fetched concurrently in a thread pool of up to max_concurrency
+        threads; requests to the same host are still made one at a time.
+        
+        Returns:
+            List of Article objects from all feeds, in configuration order
+        """
+        tasks = [(url, category) for category, urls in self.feed_urls.items() for url in urls]
+        if not tasks:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(tasks))) as executor:
+            # map yields in submission order so the result doesn't depend on timing
+            results = list(executor.map(lambda task: self._fetch_feed_logged(*task), tasks))
+        
+        return self._finish_fetch(results)
+    
+    async def fetch_all_feeds_async(self) -> List[Article]:
+        """
+        Fetch articles from all configured RSS feeds concurrently.
+        
+        Each feed is fetched in a worker thread, with at most max_concurrency
+        feeds in flight at once, so the total time approaches that of the
+        slowest feed rather than the sum of all of them.
+        
         Returns:
             List of Article objects from all feeds
         """
-        all_articles = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch_one(url: str, category: str) -> List[Article]:
+            async with semaphore:
+                return await asyncio.to_thread(self._fetch_feed_logged, url, category)
         
-        for category, urls in self.feed_urls.items():
-            logger.info(f"Fetching articles for category: {category}")
-            for url in urls:
-                try:
-                    feed_articles = self.fetch_feed(url, category)
-                    all_articles.extend(feed_articles)
-                    logger.info(f"Fetched {len(feed_articles)} articles from {url}")
-                    # Be nice to servers - add delay between requests
-                    time.sleep(1)
-                except Exception as e:
-                    logger.error(f"Error fetching feed {url}: {str(e)}")
+        results = await asyncio.gather(*[
+            fetch_one(url, category)
+            for category, urls in self.feed_urls.items()
+            for url in urls
+        ])
         
-        return all_articles
+        return self._finish_fetch(results)
+    
+    def _fetch_feed_logged(self, feed_url: str, category: str) -> List[Article]:
+        """Fetch a single feed for fetch_all_feeds*, logging the outcome instead of raising"""
+        try:
+            feed_articles = self.fetch_feed(feed_url, category)
+            logger.info(f"Fetched {len(feed_articles)} articles from {feed_url}")
+            return feed_articles
+        except Exception as e:
+            logger.error(f"Error fetching feed {feed_url}: {str(e)}")
+            return []
+    
+    def _finish_fetch(self, results: List[List[Article]]) -> List[Article]:
+        """Merge per-feed results in feed order, save the feed cache and drop duplicates"""
+        all_articles = []
+        for feed_articles in results:
+            all_articles.extend(feed_articles)
+        
+        self.save_cache()
+        return self._deduplicate(all_articles)
     
     def fetch_feed(self, feed_url: str, category: str) -> List[Article]:
         """
         Fetch and parse articles from a single RSS feed.
         
+        If the feed was fetched before, the request is made conditional on its
+        ETag/Last-Modified validators and a 304 response returns the cached
+        articles without parsing the feed again.
+        
         Args:
             feed_url: URL of the RSS feed
             category: Category of the feed
@@ -72,35 +159,206 @@ class RSSFetcher:
             List of Article objects from the feed
         """
         articles = []
-        attempts = 0
         
-        while attempts < self.retry_attempts:
+        try:
+            logger.info(f"Fetching feed: {feed_url}")
+            cached = self._get_cached_feed(feed_url)
+            headers = {}
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            
+            # Be nice to servers - one request per host at a time, spaced out
+            # by min_host_interval; different hosts are not delayed
+            host = urlparse(feed_url).netloc
+            with self._host_lock(host):
+                elapsed = time.monotonic() - self._last_hit.get(host, float('-inf'))
+                if elapsed < self.min_host_interval:
+                    time.sleep(self.min_host_interval - elapsed)
+                self._last_hit[host] = time.monotonic()
+                response = self.session.get(feed_url, headers=headers, timeout=self.request_timeout)
+            
+            if response.status_code == 304 and cached:
+                logger.info(f"Feed not modified, using cached articles: {feed_url}")
+                self._touch_cached_feed(feed_url)
+                return [Article.from_dict(data) for data in cached["articles"]]
+            
+            response.raise_for_status()
+            
+            # feedparser only parses here; the headers let it pick the right encoding
+            # and resolve relative links. Its HTML sanitizer is skipped because
+            # _extract_content strips the markup anyway
+            feed = feedparser.parse(
+                response.content,
+                response_headers={
+                    'content-type': response.headers.get('Content-Type', ''),
+                    'content-location': response.url
+                },
+                sanitize_html=False
+            )
+            
+            if feed.bozo and feed.bozo_exception:
+                logger.warning(f"Feed parsing warning for {feed_url}: {feed.bozo_exception}")
+            
+            # Get the source name from the feed
+            source_name = self._extract_source_name(feed, feed_url)
+            
+            # Process feed entries
+            for entry in feed.entries[:self.max_articles_per_feed]:
+                article = self._parse_entry(entry, source_name, category)
+                if article:
+                    articles.append(article)
+            
+            self._cache_feed(feed_url, response, articles)
+            return articles
+            
+        except Exception as e:
+            logger.error(f"Failed to fetch feed {feed_url}: {str(e)}")
+            return []
+    
+    def save_cache(self):
+        """Save the feed cache to disk if it has changed"""
+        with self._cache_lock:
+            if not self._cache_dirty:
+                return
             try:
-                logger.info(f"Fetching feed: {feed_url}")
-                feed = feedparser.parse(feed_url)
-                
-                if feed.bozo and feed.bozo_exception:
-                    logger.warning(f"Feed parsing warning for {feed_url}: {feed.bozo_exception}")
-                
-                # Get the source name from the feed
-                source_name = self._extract_source_name(feed, feed_url)
-                
-                # Process feed entries
-                for entry in feed.entries[:self.max_articles_per_feed]:
-                    article = self._parse_entry(entry, source_name, category)
-                    if article:
-                        articles.append(article)
-                
-                return articles
-                
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Write a temporary file and swap it in, so a crash mid-write
+                # never leaves a truncated cache behind
+                tmp_file = self.cache_file + ".tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._feed_cache, f)
+                os.replace(tmp_file, self.cache_file)
+                self._cache_dirty = False
+                logger.info(f"Saved feed cache with {len(self._feed_cache)} feeds")
             except Exception as e:
-                attempts += 1
-                logger.warning(f"Attempt {attempts} failed for {feed_url}: {str(e)}")
-                if attempts < self.retry_attempts:
-                    time.sleep(2)  # Wait before retrying
-                else:
-                    logger.error(f"Failed to fetch feed after {self.retry_attempts} attempts: {feed_url}")
-                    return []
+                logger.error(f"Error saving feed cache: {str(e)}")
+    
+    def _load_cache(self) -> Dict[str, dict]:
+        """Load the feed cache from disk, dropping expired entries"""
+        if not os.path.exists(self.cache_file):
+            return {}
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading feed cache: {str(e)}")
+            return {}
+        
+        now = time.time()
+        return {
+            url: entry for url, entry in cache.items()
+            if now - entry.get("fetched_at", 0) < self.cache_ttl
+        }
+    
+    def _get_cached_feed(self, feed_url: str) -> Optional[dict]:
+        """Get the cache entry for a feed if it has not expired"""
+        with self._cache_lock:
+            entry = self._feed_cache.get(feed_url)
+        if entry and time.time() - entry.get("fetched_at", 0) < self.cache_ttl:
+            return entry
+        return None
+    
+    def _touch_cached_feed(self, feed_url: str):
+        """Mark a cached feed as revalidated by the server"""
+        with self._cache_lock:
+            entry = self._feed_cache.get(feed_url)
+            if entry:
+                entry["fetched_at"] = time.time()
+                self._cache_dirty = True
+    
+    def _cache_feed(self, feed_url: str, response: requests.Response, articles: List[Article]):
+        """Store a feed's validators and articles in the cache"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        
+        with self._cache_lock:
+            if not etag and not last_modified:
+                # Nothing to revalidate against next time
+                if self._feed_cache.pop(feed_url, None) is not None:
+                    self._cache_dirty = True
+                return
+            
+            self._feed_cache[feed_url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+                "articles": [article.to_dict() for article in articles]
+            }
+            self._cache_dirty = True
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP session shared by all feed requests.
+        
+        Connections are kept alive and reused across feeds on the same host,
+        and failed requests are retried with exponential backoff, for at most
+        retry_attempts attempts in total.
+        
+        Returns:
+            Configured requests Session
+        """
+        retry = Retry(
+            # total counts retries after the first attempt
+            total=max(self.retry_attempts - 1, 0),
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': self.user_agent,
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        return session
+    
+    def _deduplicate(self, articles: List[Article]) -> List[Article]:
+        """
+        Drop articles syndicated in more than one feed.
+        
+        An article is a duplicate if its normalized URL matches an earlier
+        article, or if both its title and its content do; the first occurrence
+        is kept. Untitled articles are only matched by URL, and generic titles
+        shared by unrelated feeds don't match on their own.
+        
+        Args:
+            articles: Articles from all feeds
+            
+        Returns:
+            Articles without duplicates, in their original order
+        """
+        seen = set()
+        unique_articles = []
+        
+        for article in articles:
+            parsed = urlparse(article.url.strip())
+            url_key = ('url', parsed.netloc.lower(), parsed.path.rstrip('/'), parsed.query)
+            title = ' '.join(article.title.lower().split())
+            title_key = ('title', title, ' '.join(article.content.split())) if title else None
+            if url_key in seen or title_key in seen:
+                continue
+            seen.add(url_key)
+            if title_key is not None:
+                seen.add(title_key)
+            unique_articles.append(article)
+        
+        if len(unique_articles) < len(articles):
+            logger.info(f"Dropped {len(articles) - len(unique_articles)} duplicate articles")
+        
+        return unique_articles
+    
+    def _host_lock(self, host: str) -> threading.Lock:
+        """Get the lock serializing requests to a host"""
+        with self._host_locks_guard:
+            if host not in self._host_locks:
+                self._host_locks[host] = threading.Lock()
+            return self._host_locks[host]
     
     def _parse_entry(self, entry, source_name: str, category: str) -> Optional[Article]:
         """
@@ -124,8 +382,8 @@ class RSSFetcher:
             # Get the content or summary
             content = self._extract_content(entry)
             
-            # Create a unique ID for the article
-            article_id = str(uuid.uuid4())
+            # Derive the ID from the URL so the same article keeps its ID across runs
+            article_id = str(uuid.uuid5(uuid.NAMESPACE_URL, article_url))
             
             # Extract author if available
             author = entry.get('author', None)
@@ -166,7 +424,7 @@ class RSSFetcher:
         for date_field in ['published_parsed', 'updated_parsed', 'created_parsed']:
             if hasattr(entry, date_field) and getattr(entry, date_field):
                 time_struct = getattr(entry, date_field)
-                return datetime.fromtimestamp(time.mktime(time_struct))
+                return datetime(*time_struct[:6])
         
         # Fallback to current time if no date is found
         return datetime.now()
@@ -185,8 +443,11 @@ class RSSFetcher:
         
         # Clean HTML content if necessary
         if '<' in content and '>' in content:
-            soup = BeautifulSoup(content, 'html.parser')
-            content = soup.get_text(separator=' ', strip=True)
+            if _NON_TEXT_MARKUP_RE.search(content):
+                soup = _make_soup(content)
+                content = soup.get_text(separator=' ', strip=True)
+            else:
+                content = ' '.join(html.unescape(_TAG_RE.sub(' ', content)).split())
         
         return content
     
@@ -213,10 +474,8 @@ class RSSFetcher:
         # Look for image in content
         if hasattr(entry, 'content') and entry.content:
             content = entry.content[0].value
-            if '<img' in content:
-                soup = BeautifulSoup(content, 'html.parser')
-                img = soup.find('img')
-                if img and img.has_attr('src'):
-                    return img['src']
+            match = _IMG_SRC_RE.search(content)
+            if match:
+                return html.unescape(match.group(1))
         
         return None
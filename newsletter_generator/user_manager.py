@@ -1,31 +1,82 @@
 import os
 import json
 import uuid
+import atexit
 import logging
+import threading
+import weakref
+from contextlib import contextmanager
 from typing import List, Dict, Optional
 
 from newsletter_generator.models.user import User
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data, pretty: bool = False) -> bytes:
+    """Serialize data to JSON bytes, compact unless pretty, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    # Write non-ASCII names as UTF-8 rather than \u escapes, like orjson does
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Deserialize JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Managers that may hold unsaved changes, flushed when the interpreter exits
+_live_managers: "weakref.WeakSet[UserManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers():
+    for manager in list(_live_managers):
+        manager.flush()
+
+
 class UserManager:
     """
     Manages user profiles and preferences for the newsletter system.
     """
     
-    def __init__(self, data_dir: str = "newsletter_generator/data"):
+    def __init__(self, data_dir: str = "newsletter_generator/data", save_delay: float = 0,
+                 pretty_json: bool = False):
         """
         Initialize the user manager.
         
+        By default every change is written to disk straight away. With a
+        positive save_delay, changes are instead written in the background
+        save_delay seconds after the first unsaved change, so a burst of edits
+        costs a single write; call flush() to write pending changes immediately.
+        They are also written when the interpreter exits, and before another
+        manager loads the same users file.
+        
         Args:
             data_dir: Directory to store user profiles
+            save_delay: Seconds to wait for further changes before saving (0 saves immediately)
+            pretty_json: Write users.json indented for reading and hand editing
         """
         self.data_dir = data_dir
         self.users_file = os.path.join(data_dir, "users.json")
         self.users: Dict[str, User] = {}
+        self.save_delay = save_delay
+        self.pretty_json = pretty_json
+        self._dirty = False
+        self._batch_depth = 0
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        _live_managers.add(self)
         
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
@@ -75,7 +126,7 @@ class UserManager:
         Returns:
             Newly created User object
         """
-        user_id = str(uuid.uuid4())
+        user_id = uuid.uuid4().hex
         user = User(
             id=user_id,
             name=name,
@@ -87,7 +138,7 @@ class UserManager:
         )
         
         self.users[user_id] = user
-        self._save_users()
+        self._mark_dirty()
         logger.info(f"Created new user: {name} ({user_id})")
         
         return user
@@ -112,8 +163,9 @@ class UserManager:
         for key, value in kwargs.items():
             if hasattr(user, key):
                 setattr(user, key, value)
+        user.refresh_preferences()
         
-        self._save_users()
+        self._mark_dirty()
         logger.info(f"Updated user: {user.name} ({user_id})")
         
         return user
@@ -131,23 +183,64 @@ class UserManager:
         if user_id in self.users:
             user = self.users[user_id]
             del self.users[user_id]
-            self._save_users()
+            self._mark_dirty()
             logger.info(f"Deleted user: {user.name} ({user_id})")
             return True
         
         logger.warning(f"User not found for deletion: {user_id}")
         return False
     
+    def flush(self):
+        """Write pending changes to disk now"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._dirty = False
+                self._save_users()
+    
+    def _mark_dirty(self):
+        """Record an unsaved change and save it, or schedule a save, unless inside a batch"""
+        with self._save_lock:
+            self._dirty = True
+            if self._batch_depth > 0:
+                return
+            if self.save_delay <= 0:
+                self.flush()
+            elif self._save_timer is None:
+                self._save_timer = threading.Timer(self.save_delay, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    @contextmanager
+    def _batch(self):
+        """Hold back saves until the block ends, then write everything once"""
+        with self._save_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._save_lock:
+                self._batch_depth -= 1
+                outermost = self._batch_depth == 0
+            if outermost:
+                self.flush()
+    
     def _load_users(self):
         """Load users from the JSON file"""
+        # Write out changes other managers are still holding for this file,
+        # so they are not missed here and then overwritten
+        for manager in list(_live_managers):
+            if manager is not self and os.path.abspath(manager.users_file) == os.path.abspath(self.users_file):
+                manager.flush()
+        
         if os.path.exists(self.users_file):
             try:
-                with open(self.users_file, 'r') as f:
-                    users_data = json.load(f)
+                with open(self.users_file, 'rb') as f:
+                    users_data = _loads(f.read())
                 
-                for user_data in users_data:
-                    user = User.from_dict(user_data)
-                    self.users[user.id] = user
+                self.users = {user.id: user for user in map(User.from_dict, users_data)}
                 
                 logger.info(f"Loaded {len(self.users)} users")
             except Exception as e:
@@ -159,8 +252,12 @@ class UserManager:
         """Save users to the JSON file"""
         try:
             users_data = [user.to_dict() for user in self.users.values()]
-            with open(self.users_file, 'w') as f:
-                json.dump(users_data, f, indent=2)
+            # Write a temporary file and swap it in, so a crash mid-write
+            # never leaves a truncated users file behind
+            tmp_file = self.users_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(users_data, self.pretty_json))
+            os.replace(tmp_file, self.users_file)
             
             logger.info(f"Saved {len(self.users)} users")
         except Exception as e:
@@ -168,7 +265,13 @@ class UserManager:
     
     def _create_default_personas(self):
         """Create default user personas"""
+        with self._batch():
+            self._create_personas()
         
+        logger.info("Created default user personas")
+    
+    def _create_personas(self):
+        """Create each default persona; saving is left to the caller"""
         # Alex Parker (Tech Enthusiast)
         self.create_user(
             name="Alex Parker",
@@ -218,5 +321,3 @@ class UserManager:
             preferred_categories=["science"],
             persona="science_nerd"
         )
-        
-        logger.info("Created default user personas")
@@ -1,16 +1,88 @@
 import re
-import string
+import heapq
 import logging
-from typing import List, Dict, Set, Tuple, Optional
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
+import numpy as np
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Set, Tuple, Optional
 from collections import Counter
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Use NLTK's Punkt/Treebank tokenizers instead of the much faster regex ones,
+# for callers that need their handling of abbreviations and contractions. The
+# memoized helpers below take the flag as part of their cache key, so results
+# from one tokenizer are never served while the other is selected
+USE_NLTK = False
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+_SENT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+# A run of HTML tags and whitespace, which clean_text turns into a single space
+_TAGS_AND_SPACE_RE = re.compile(r'(?:<[^>]+>|\s+)+')
+_SENT_END_RE = re.compile(r'[.!?]')
+
+# Texts shorter than this many characters per requested summary sentence are
+# already summary-sized and are returned as they are
+_SUMMARY_CHARS_PER_SENTENCE = 60
+
+
+# NLTK is imported on first use rather than with this module, so callers that
+# only need the regex helpers such as clean_text never pay for it
+@lru_cache(maxsize=1)
+def _stop_words() -> FrozenSet[str]:
+    """Load the English stopword list once, on first use"""
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+
+@lru_cache(maxsize=1)
+def _lemmatizer():
+    """Create the WordNet lemmatizer once, on first use"""
+    from nltk.stem import WordNetLemmatizer
+    return WordNetLemmatizer()
+
+
+@lru_cache(maxsize=100_000)
+def _lemma(word: str) -> str:
+    """Lemmatize a word, memoized since the same words recur across articles"""
+    return _lemmatizer().lemmatize(word)
+
+
+@lru_cache(maxsize=1)
+def _punkt_available() -> bool:
+    """Check for the Punkt model used by NLTK's tokenizers, downloading it once if missing"""
+    import nltk
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        logger.info("Downloading required NLTK data: punkt")
+        return bool(nltk.download('punkt', quiet=True))
+    return True
+
+
+def _nltk_tokenizers():
+    """Import NLTK's word and sentence tokenizers, failing clearly without Punkt"""
+    if not _punkt_available():
+        raise LookupError("USE_NLTK is set but the NLTK 'punkt' tokenizer model is "
+                          "not installed and could not be downloaded")
+    from nltk.tokenize import sent_tokenize, word_tokenize
+    return word_tokenize, sent_tokenize
+
+
+def _words(text: str) -> List[str]:
+    """Split text into alphabetic words, dropping punctuation and numbers"""
+    if USE_NLTK:
+        word_tokenize, _ = _nltk_tokenizers()
+        return [word for word in word_tokenize(text) if word.isalpha()]
+    return _WORD_RE.findall(text)
+
+
+def _sentences(text: str) -> List[str]:
+    """Split text into sentences"""
+    if USE_NLTK:
+        _, sent_tokenize = _nltk_tokenizers()
+        return sent_tokenize(text)
+    return _SENT_RE.split(text)
+
 
 def clean_text(text: str) -> str:
     """
@@ -22,11 +94,8 @@ def clean_text(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', text)
-    
-    # Replace multiple spaces with a single space
-    text = re.sub(r'\s+', ' ', text)
+    # Remove HTML tags and collapse whitespace in a single pass
+    text = _TAGS_AND_SPACE_RE.sub(' ', text)
     
     # Remove leading/trailing whitespace
     text = text.strip()
@@ -34,13 +103,54 @@ def clean_text(text: str) -> str:
     return text
 
 
-def extract_sentences(text: str, max_sentences: int = 5) -> List[str]:
+def score_sentences(sentence_tokens: List[List[str]], word_freq: Dict[str, int]) -> List[float]:
+    """
+    Score tokenized sentences by the frequency of their words.
+    
+    A sentence's score is the sum of its tokens' frequencies divided by its
+    token count, so long sentences aren't favored; tokens missing from
+    word_freq count as zero, and sentences without tokens score zero.
+    
+    Args:
+        sentence_tokens: Tokens of each sentence
+        word_freq: Frequency of each scoring word
+        
+    Returns:
+        Score of each sentence, in order
+    """
+    # Give every counted word an id into a frequency vector; anything else maps
+    # to the trailing zero entry
+    token_ids = {word: i for i, word in enumerate(word_freq)}
+    unknown_id = len(token_ids)
+    freqs = np.zeros(unknown_id + 1)
+    freqs[:unknown_id] = np.fromiter(word_freq.values(), dtype=np.float64, count=unknown_id)
+    
+    # Flatten the tokenized sentences into parallel (sentence id, token id) arrays
+    num_sentences = len(sentence_tokens)
+    lengths = np.fromiter((len(tokens) for tokens in sentence_tokens), dtype=np.int64,
+                          count=num_sentences)
+    flat_ids = np.fromiter(
+        (token_ids.get(token, unknown_id) for tokens in sentence_tokens for token in tokens),
+        dtype=np.int64,
+        count=int(lengths.sum())
+    )
+    sentence_ids = np.repeat(np.arange(num_sentences), lengths)
+    
+    # Sum each sentence's word frequencies in a single vectorized pass and
+    # divide by its length
+    totals = np.bincount(sentence_ids, weights=freqs[flat_ids], minlength=num_sentences)
+    return np.divide(totals, lengths, out=np.zeros(num_sentences), where=lengths > 0).tolist()
+
+
+def extract_sentences(text: str, max_sentences: int = 5,
+                      word_freq: Optional[Counter] = None) -> List[str]:
     """
     Extract the most important sentences from a text.
     
     Args:
         text: Text to extract sentences from
         max_sentences: Maximum number of sentences to extract
+        word_freq: Word frequencies of the text from analyze_text(), if already computed
         
     Returns:
         List of extracted sentences
@@ -48,31 +158,30 @@ def extract_sentences(text: str, max_sentences: int = 5) -> List[str]:
     # Clean the text
     text = clean_text(text)
     
+    # Nothing to split
+    if not text:
+        return []
+    
     # Split into sentences
-    sentences = sent_tokenize(text)
+    sentences = _sentences(text)
     
     # If there are fewer sentences than requested, return all of them
     if len(sentences) <= max_sentences:
         return sentences
     
-    # Calculate word frequencies
-    word_freq = calculate_word_frequency(text)
+    # Tokenize each sentence once; word frequencies over the whole text are
+    # counted from the same tokens
+    sentence_words = [_words(sentence.lower()) for sentence in sentences]
+    if word_freq is None:
+        stop_words = _stop_words()
+        word_freq = Counter(word for words in sentence_words for word in words if word not in stop_words)
     
-    # Score sentences based on word frequencies
-    sentence_scores = {}
-    for i, sentence in enumerate(sentences):
-        words = word_tokenize(sentence.lower())
-        word_count = len([w for w in words if w.lower() not in string.punctuation])
-        
-        if word_count == 0:
-            continue
-            
-        # Calculate score as sum of word frequencies divided by word count
-        score = sum(word_freq.get(word.lower(), 0) for word in words) / word_count
-        sentence_scores[i] = score
+    scores = score_sentences(sentence_words, word_freq)
     
-    # Get indices of top sentences
-    top_indices = sorted(sentence_scores.keys(), key=lambda i: sentence_scores[i], reverse=True)[:max_sentences]
+    # Get indices of top sentences without sorting every score; sentences
+    # without words are never picked
+    candidates = [i for i, words in enumerate(sentence_words) if words]
+    top_indices = heapq.nlargest(max_sentences, candidates, key=scores.__getitem__)
     
     # Sort indices to maintain original order
     top_indices.sort()
@@ -92,36 +201,54 @@ def calculate_word_frequency(text: str) -> Dict[str, int]:
         Dictionary mapping words to their frequencies
     """
     # Tokenize text
-    words = word_tokenize(text.lower())
+    words = _words(text.lower())
+    
+    # Count word frequencies, skipping stopwords without building a filtered list
+    stop_words = _stop_words()
+    return Counter(word for word in words if word not in stop_words)
+
+
+def analyze_text(text: str) -> Tuple[List[str], Counter]:
+    """
+    Tokenize a text once for the helpers that work on its words.
     
-    # Remove stopwords and punctuation
-    stop_words = set(stopwords.words('english'))
-    filtered_words = [word for word in words 
-                     if word.isalpha() and word not in stop_words]
+    Pass the result to generate_summary() and extract_keywords() when both are
+    needed for the same text, so it is only tokenized once.
     
-    # Count word frequencies
-    return Counter(filtered_words)
+    Args:
+        text: Text to analyze
+        
+    Returns:
+        Tuple of the lowercased words of the cleaned text, and the frequencies
+        of those words excluding stopwords
+    """
+    words = _words(clean_text(text).lower())
+    stop_words = _stop_words()
+    return words, Counter(word for word in words if word not in stop_words)
 
 
-def generate_summary(text: str, max_sentences: int = 3) -> str:
+def generate_summary(text: str, max_sentences: int = 3,
+                     analysis: Optional[Tuple[List[str], Counter]] = None) -> str:
     """
     Generate a summary of the text.
     
     Args:
         text: Text to summarize
         max_sentences: Maximum number of sentences in the summary
+        analysis: Result of analyze_text() for this text, if already computed
         
     Returns:
         Summary text
     """
     try:
-        # Extract important sentences
-        sentences = extract_sentences(text, max_sentences)
-        
-        # Join sentences into a summary
-        summary = ' '.join(sentences)
+        # Skip sentence scoring for headlines and short blurbs
+        cleaned = clean_text(text)
+        if len(cleaned) < max_sentences * _SUMMARY_CHARS_PER_SENTENCE or not _SENT_END_RE.search(cleaned):
+            return cleaned
         
-        return summary
+        if analysis is not None:
+            return ' '.join(extract_sentences(cleaned, max_sentences, analysis[1]))
+        return _summary_for(text, max_sentences, USE_NLTK)
     except Exception as e:
         logger.error(f"Error generating summary: {str(e)}")
         # Return a truncated version of the text as fallback
@@ -131,7 +258,24 @@ def generate_summary(text: str, max_sentences: int = 3) -> str:
         return text
 
 
-def extract_keywords(text: str, max_keywords: int = 10, min_length: int = 3) -> List[str]:
+@lru_cache(maxsize=1024)
+def _summary_for(text: str, max_sentences: int, use_nltk: bool) -> str:
+    """
+    Summarize a text, memoized since the same article is often summarized again.
+    
+    use_nltk is only part of the cache key. Each entry keeps the full text
+    alive, so the cache is sized for one run's articles rather than for reuse
+    across runs.
+    """
+    # Extract important sentences
+    sentences = extract_sentences(text, max_sentences)
+    
+    # Join sentences into a summary
+    return ' '.join(sentences)
+
+
+def extract_keywords(text: str, max_keywords: int = 10, min_length: int = 3,
+                     analysis: Optional[Tuple[List[str], Counter]] = None) -> List[str]:
     """
     Extract keywords from text.
     
@@ -139,40 +283,46 @@ def extract_keywords(text: str, max_keywords: int = 10, min_length: int = 3) ->
         text: Text to extract keywords from
         max_keywords: Maximum number of keywords to extract
         min_length: Minimum length of keywords
+        analysis: Result of analyze_text() for this text, if already computed
         
     Returns:
         List of keywords
     """
     try:
-        # Clean and tokenize text
-        text = clean_text(text)
-        words = word_tokenize(text.lower())
-        
-        # Remove stopwords, punctuation, and short words
-        stop_words = set(stopwords.words('english'))
-        lemmatizer = WordNetLemmatizer()
-        
-        filtered_words = []
-        for word in words:
-            if (word.isalpha() and 
-                word not in stop_words and 
-                len(word) >= min_length):
-                # Lemmatize word
-                lemma = lemmatizer.lemmatize(word)
-                filtered_words.append(lemma)
-        
-        # Count word frequencies
-        word_counts = Counter(filtered_words)
-        
-        # Get most common words
-        keywords = [word for word, _ in word_counts.most_common(max_keywords)]
-        
-        return keywords
+        if analysis is not None:
+            return list(_top_keywords(analysis[1], max_keywords, min_length))
+        # Copy, so callers can't modify the memoized result
+        return list(_keywords_for(text, max_keywords, min_length, USE_NLTK))
     except Exception as e:
         logger.error(f"Error extracting keywords: {str(e)}")
         return []
 
 
+@lru_cache(maxsize=1024)
+def _keywords_for(text: str, max_keywords: int, min_length: int, use_nltk: bool) -> Tuple[str, ...]:
+    """
+    Extract keywords from a text, memoized per text and settings.
+    
+    use_nltk is only part of the cache key. Each entry keeps the full text
+    alive, as with _summary_for.
+    """
+    _, word_freq = analyze_text(text)
+    return _top_keywords(word_freq, max_keywords, min_length)
+
+
+def _top_keywords(word_freq: Counter, max_keywords: int, min_length: int) -> Tuple[str, ...]:
+    """Pick the most frequent lemmas from a text's word frequencies"""
+    # Merge the counts of words sharing a lemma, skipping short words; each
+    # distinct word is lemmatized once
+    lemma_counts = Counter()
+    for word, count in word_freq.items():
+        if len(word) >= min_length:
+            lemma_counts[_lemma(word)] += count
+    
+    # Get most common words
+    return tuple(word for word, _ in lemma_counts.most_common(max_keywords))
+
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """
     Calculate the similarity between two texts using Jaccard similarity.
@@ -185,23 +335,55 @@ def calculate_similarity(text1: str, text2: str) -> float:
         Similarity score between 0 and 1
     """
     try:
-        # Tokenize and clean texts
-        words1 = set(word_tokenize(clean_text(text1).lower()))
-        words2 = set(word_tokenize(clean_text(text2).lower()))
-        
-        # Remove stopwords and punctuation
-        stop_words = set(stopwords.words('english'))
-        words1 = {w for w in words1 if w.isalpha() and w not in stop_words}
-        words2 = {w for w in words2 if w.isalpha() and w not in stop_words}
-        
-        # Calculate Jaccard similarity
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        if union == 0:
-            return 0.0
-            
-        return intersection / union
+        # Word sets are memoized per text, so comparing one text against
+        # many others only tokenizes it once
+        return token_similarity(text_tokens(text1), text_tokens(text2))
     except Exception as e:
         logger.error(f"Error calculating similarity: {str(e)}")
         return 0.0
+
+
+def token_similarity(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+    """
+    Calculate the Jaccard similarity of two precomputed word sets.
+    
+    Use with text_tokens() when comparing many texts pairwise, so each text's
+    word set is computed once up front.
+    
+    Args:
+        words1: Words of the first text
+        words2: Words of the second text
+        
+    Returns:
+        Similarity score between 0 and 1
+    """
+    # Only the intersection is built; the union size follows from it
+    intersection = len(words1.intersection(words2))
+    union = len(words1) + len(words2) - intersection
+    
+    if union == 0:
+        return 0.0
+        
+    return intersection / union
+
+
+def text_tokens(text: str) -> FrozenSet[str]:
+    """
+    Get the distinct words of a text used for similarity, excluding stopwords.
+    
+    Results are memoized by text content and tokenizer, for up to 2048 texts;
+    each entry keeps the full text alive.
+    
+    Args:
+        text: Text to tokenize
+        
+    Returns:
+        Set of lowercased words
+    """
+    return _text_tokens(text, USE_NLTK)
+
+
+@lru_cache(maxsize=2048)
+def _text_tokens(text: str, use_nltk: bool) -> FrozenSet[str]:
+    """Tokenize a text for similarity, memoized; use_nltk is only part of the cache key"""
+    return frozenset(_words(clean_text(text).lower())) - _stop_words()
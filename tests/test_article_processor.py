@@ -0,0 +1,33 @@
+import unittest
+
+from newsletter_generator.article_processor import ArticleProcessor
+
+
+class ExtractKeywordsTest(unittest.TestCase):
+    """Keyword extraction must only return words"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.processor = ArticleProcessor(max_workers=1)
+    
+    def test_no_whitespace_or_punctuation_keywords(self):
+        text = ("Markets rallied today.\n\n   Investors cheered the news. ... "
+                "Stocks rose again -- and again…\n\t\n Markets closed higher!")
+        
+        keywords = self.processor.extract_keywords(text)
+        
+        self.assertIn("market", keywords)
+        for keyword in keywords:
+            self.assertEqual(keyword, keyword.strip())
+            self.assertTrue(keyword)
+            self.assertTrue(any(char.isalnum() for char in keyword),
+                            f"punctuation keyword: {keyword!r}")
+    
+    def test_whitespace_runs_are_not_tokens(self):
+        tokens = self.processor._tokenize("Markets rallied.\n\n   Investors cheered.")
+        
+        self.assertFalse([token for token in tokens if token.isspace()])
+
+
+if __name__ == "__main__":
+    unittest.main()
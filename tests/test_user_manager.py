@@ -0,0 +1,45 @@
+import tempfile
+import unittest
+
+from newsletter_generator.user_manager import UserManager
+
+
+class TwoManagersTest(unittest.TestCase):
+    """Managers sharing a users file must not lose each other's changes"""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_dir = self._tmp.name
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _names_on_disk(self):
+        return {user.name for user in UserManager(self.data_dir).get_all_users()}
+    
+    def test_write_through_by_default(self):
+        first = UserManager(self.data_dir)
+        first.create_user("Late", "late@example.com")
+        
+        second = UserManager(self.data_dir)
+        self.assertIn("Late", {user.name for user in second.get_all_users()})
+        second.create_user("Other", "other@example.com")
+        second.flush()
+        first.flush()
+        
+        self.assertTrue({"Late", "Other"} <= self._names_on_disk())
+    
+    def test_pending_changes_are_written_before_another_manager_loads(self):
+        first = UserManager(self.data_dir, save_delay=60)
+        first.create_user("Late", "late@example.com")
+        
+        second = UserManager(self.data_dir, save_delay=60)
+        self.assertIn("Late", {user.name for user in second.get_all_users()})
+        second.flush()
+        first.flush()
+        
+        self.assertIn("Late", self._names_on_disk())
+
+
+if __name__ == "__main__":
+    unittest.main()